@@ -2,38 +2,81 @@
 """
 Simple serial echo server for testing termiHub serial connections.
 
-Reads from a virtual serial port and echoes each line back with a prefix.
+Reads from one or more virtual serial ports and echoes everything back.
 Useful with the virtual serial pair created by setup-virtual-serial.sh.
 
 Usage:
-    python3 serial-echo-server.py [port]
+    python3 serial-echo-server.py [port ...]
 
-    port  Path to the serial device (default: /tmp/termihub-serial-b)
+    port  Path to a serial device (default: /tmp/termihub-serial-b)
 """
 
 import sys
 import os
-import time
+import errno
+import selectors
+import termios
+import tty
 
 
 def main():
-    port = sys.argv[1] if len(sys.argv) > 1 else "/tmp/termihub-serial-b"
+    ports = sys.argv[1:] or ["/tmp/termihub-serial-b"]
 
-    if not os.path.exists(port):
-        print(f"Error: {port} does not exist.")
-        print("Run setup-virtual-serial.sh first to create the virtual serial pair.")
-        sys.exit(1)
+    # Epoll on Linux, kqueue on macOS: waiting costs O(ready ports), not O(ports)
+    sel = selectors.DefaultSelector()
+    saved_attrs = {}
+    try:
+        for port in ports:
+            try:
+                fd = os.open(port, os.O_RDWR | os.O_NOCTTY)
+            except FileNotFoundError:
+                print(f"Error: {port} does not exist.", file=sys.stderr)
+                print(
+                    "Run setup-virtual-serial.sh first to create the virtual serial pair.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            saved_attrs[fd] = termios.tcgetattr(fd)
+            # Raw mode: no line buffering or local echo. setraw also sets VMIN=1,
+            # VTIME=0 so a read returns as soon as one byte arrives instead of
+            # waiting for more data or an inter-byte timer.
+            tty.setraw(fd)
+            sel.register(fd, selectors.EVENT_READ)
+            print(f"Echo server listening on {port}")
 
-    print(f"Echo server listening on {port}")
-    print("Press Ctrl+C to stop.\n")
+        print("Press Ctrl+C to stop.\n")
 
-    with open(port, "r+b", buffering=0) as f:
+        # One buffer reused for every read instead of a new bytes object each time
+        buf = bytearray(4096)
+        bufs = [buf]
+        view = memoryview(buf)
         while True:
-            data = f.read(1)
-            if data:
-                # Echo back the received byte
-                f.write(data)
-                f.flush()
+            for key, _ in sel.select():
+                try:
+                    n = os.readv(key.fd, bufs)
+                except BlockingIOError:
+                    continue
+                except OSError as e:
+                    # Linux reports a hung-up pty as EIO rather than EOF
+                    if e.errno != errno.EIO:
+                        raise
+                    n = 0
+                if n == 0:
+                    # EOF: the device went away, stop serving it
+                    sel.unregister(key.fd)
+                    if not sel.get_map():
+                        return
+                    continue
+                # Echo back everything received in one write
+                os.write(key.fd, view[:n])
+    finally:
+        sel.close()
+        for fd, attrs in saved_attrs.items():
+            try:
+                termios.tcsetattr(fd, termios.TCSAFLUSH, attrs)
+            except termios.error:
+                pass  # the port hung up; nothing left to restore
+            os.close(fd)
 
 
 if __name__ == "__main__":
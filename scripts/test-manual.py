@@ -15,17 +15,25 @@ from __future__ import annotations
 
 import argparse
 import atexit
+import copy
 import datetime
+import hashlib
 import json
 import os
+import pickle
 import platform
+import re
 import shutil
 import signal
 import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -35,32 +43,91 @@ except ImportError:
     print("ERROR: PyYAML is required. Install with: pip install pyyaml")
     sys.exit(1)
 
+# The libyaml-backed loader is an order of magnitude faster than pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+    print("WARNING: PyYAML was built without libyaml; test definitions load slowly.")
+
+# orjson is optional; it serializes large reports several times faster
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 # ---------------------------------------------------------------------------
-# Constants
+# Paths
 # ---------------------------------------------------------------------------
 
-REPO_ROOT = Path(subprocess.check_output(
-    ["git", "rev-parse", "--show-toplevel"],
-    text=True,
-).strip())
+@lru_cache(maxsize=None)
+def repo_root() -> Path:
+    """Return the repository root, resolved on first use.
+
+    Walks up from this script looking for .git and only asks git when that
+    fails, so --help and --list do not pay for a subprocess.
+    """
+    here = Path(__file__).resolve()
+    for parent in here.parents:
+        if (parent / ".git").exists():
+            return parent
+    return Path(subprocess.check_output(
+        ["git", "rev-parse", "--show-toplevel"],
+        text=True,
+    ).strip())
+
+
+def tests_dir() -> Path:
+    """Directory holding the manual test YAML files."""
+    return repo_root() / "tests" / "manual"
+
+
+def default_report_dir() -> Path:
+    """Directory reports are written to unless --report-dir is given."""
+    return repo_root() / "tests" / "reports"
+
+
+def docker_compose_file() -> Path:
+    """Compose file for the Docker test containers."""
+    return repo_root() / "tests" / "docker" / "docker-compose.yml"
+
+
+# Virtual serial port pair created by socat (termiHub side, echo side)
+def cache_dir() -> Path:
+    """Per-user cache directory for state kept between runs."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "termihub"
+
+
+def image_stamp_file() -> Path:
+    """Records which build context hash each test image was built from."""
+    return cache_dir() / "docker-images.json"
 
-TESTS_DIR = REPO_ROOT / "tests" / "manual"
-DEFAULT_REPORT_DIR = REPO_ROOT / "tests" / "reports"
-DOCKER_COMPOSE = REPO_ROOT / "tests" / "docker" / "docker-compose.yml"
 
-# Platform-specific app binary paths (release builds)
-APP_PATHS: dict[str, Path] = {
-    "macos": REPO_ROOT / "src-tauri" / "target" / "release" / "bundle" / "macos" / "termiHub.app" / "Contents" / "MacOS" / "termiHub",
-    "linux": REPO_ROOT / "src-tauri" / "target" / "release" / "termihub",
-    "windows": REPO_ROOT / "src-tauri" / "target" / "release" / "termihub.exe",
-}
+_SOCAT_LINKS = (Path("/tmp/termihub-serial-a"), Path("/tmp/termihub-serial-b"))
+
+
+@lru_cache(maxsize=None)
+def app_paths() -> dict[str, Path]:
+    """Platform-specific app binary paths (release builds)."""
+    release = repo_root() / "src-tauri" / "target" / "release"
+    return {
+        "macos": release / "bundle" / "macos" / "termiHub.app" / "Contents" / "MacOS" / "termiHub",
+        "linux": release / "termihub",
+        "windows": release / "termihub.exe",
+    }
 
 
 # ---------------------------------------------------------------------------
 # Platform detection
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def detect_platform() -> str:
     """Return 'macos', 'linux', or 'windows'."""
     system = platform.system().lower()
@@ -73,6 +140,7 @@ def detect_platform() -> str:
     return system
 
 
+@lru_cache(maxsize=None)
 def detect_arch() -> str:
     """Return architecture (e.g. 'x86_64', 'aarch64')."""
     machine = platform.machine().lower()
@@ -83,6 +151,7 @@ def detect_arch() -> str:
     return machine
 
 
+@lru_cache(maxsize=None)
 def detect_os_version() -> str:
     """Return a human-readable OS version string."""
     system = platform.system()
@@ -101,16 +170,150 @@ def detect_os_version() -> str:
     return platform.platform()
 
 
+_IS_WINDOWS = detect_platform() == "windows"
+
+
+@lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """Cached shutil.which: PATH does not change during a session."""
+    return shutil.which(name)
+
+
+def _port_open(port: int, timeout: float = 1.0) -> bool:
+    """Check whether something accepts TCP connections on a local port."""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=timeout):
+            return True
+    except OSError:  # refused, timed out or unreachable
+        return False
+
+
+def _context_hash(paths: list[Path]) -> str:
+    """Hash the file names and contents under the given build context dirs.
+
+    Unlike mtimes, this stays the same when files are touched or checked out
+    again without changing.
+    """
+    h = hashlib.sha256()
+    for root in paths:
+        h.update(f"\0{root}\0".encode())
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                h.update(os.path.relpath(path, root).encode() + b"\0")
+                try:
+                    with open(path, "rb") as f:
+                        h.update(f.read())
+                except OSError:
+                    continue
+    return h.hexdigest()
+
+
+_UTC = datetime.timezone.utc
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, as used in result entries."""
+    return datetime.datetime.now(_UTC).isoformat()
+
+
 # ---------------------------------------------------------------------------
 # YAML loading
 # ---------------------------------------------------------------------------
 
+# Parsed YAML keyed by path -> (mtime, size, data), least recently used first
+_YAML_CACHE: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+_YAML_CACHE_MAX = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
+# The in-memory cache is persisted between runs so unchanged files skip YAML
+_YAML_DISK_CACHE_VERSION = 1
+_yaml_disk_cache_loaded = False
+_yaml_cache_dirty = False
+
+
+def yaml_cache_file() -> Path:
+    """On-disk cache of parsed test definitions, shared between runs."""
+    return cache_dir() / "manual-tests.pkl"
+
+
+def _load_yaml_disk_cache() -> None:
+    """Seed the in-memory YAML cache from disk (once per process)."""
+    global _yaml_disk_cache_loaded
+    if _yaml_disk_cache_loaded:
+        return
+    _yaml_disk_cache_loaded = True
+    try:
+        with open(yaml_cache_file(), "rb") as f:
+            stored = pickle.load(f)
+    except Exception:  # missing, truncated or incompatible: just reparse
+        return
+    if not isinstance(stored, dict) or stored.get("version") != _YAML_DISK_CACHE_VERSION:
+        return
+    with _YAML_CACHE_LOCK:
+        for key, entry in stored.get("entries", {}).items():
+            _YAML_CACHE.setdefault(key, entry)
+
+
+def _save_yaml_disk_cache() -> None:
+    """Write the YAML cache back to disk if anything was reparsed."""
+    global _yaml_cache_dirty
+    if not _yaml_cache_dirty:
+        return
+    path = yaml_cache_file()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with _YAML_CACHE_LOCK:
+        payload = {"version": _YAML_DISK_CACHE_VERSION, "entries": dict(_YAML_CACHE)}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        _yaml_cache_dirty = False
+    except OSError:
+        # The cache is only an optimization
+        tmp.unlink(missing_ok=True)
+
+
+def load_yaml_file(yaml_file: Path) -> Any:
+    """Parse a YAML file, reusing the cached result if the file is unchanged."""
+    global _yaml_cache_dirty
+    key = str(yaml_file)
+    st = yaml_file.stat()
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            _YAML_CACHE.move_to_end(key)
+        else:
+            cached = None
+    if cached:
+        # Callers annotate the test dicts in place, so never hand out the cached
+        # copy. Copy outside the lock so parallel loads do not serialize on it.
+        return copy.deepcopy(cached[2])
+    data = yaml.load(yaml_file.read_bytes(), Loader=_YamlLoader)
+    with _YAML_CACHE_LOCK:
+        _yaml_cache_dirty = True
+        _YAML_CACHE[key] = (st.st_mtime, st.st_size, data)
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
 def load_tests(tests_dir: Path) -> list[dict[str, Any]]:
     """Load all YAML test files and return a flat list of tests."""
+    yaml_files = sorted(tests_dir.glob("*.yaml"))
+    if not yaml_files:
+        return []
+    _load_yaml_disk_cache()
+    # File reads dominate, so parse in parallel; map() keeps the sorted order
+    with ThreadPoolExecutor(max_workers=min(8, len(yaml_files))) as pool:
+        parsed = list(pool.map(load_yaml_file, yaml_files))
+    _save_yaml_disk_cache()
+
     all_tests: list[dict[str, Any]] = []
-    for yaml_file in sorted(tests_dir.glob("*.yaml")):
-        with open(yaml_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+    for yaml_file, data in zip(yaml_files, parsed):
         if not data or "tests" not in data:
             continue
         category = data.get("category", yaml_file.stem)
@@ -118,6 +321,9 @@ def load_tests(tests_dir: Path) -> list[dict[str, Any]]:
         for test in data["tests"]:
             test["_category"] = category
             test["_display_name"] = display_name
+            platforms = test.get("platforms", ["all"])
+            test["_platforms"] = frozenset(platforms)
+            test["_platforms_str"] = ", ".join(platforms)
             all_tests.append(test)
     return all_tests
 
@@ -129,15 +335,16 @@ def filter_tests(
     test_id: str | None = None,
 ) -> list[dict[str, Any]]:
     """Filter tests by platform and optional category/ID."""
+    if test_id:
+        match = next((t for t in tests if t["id"] == test_id), None)
+        tests = [match] if match else []
+    keep = {current_platform, "all"}
     result = []
     for t in tests:
-        platforms = t.get("platforms", ["all"])
-        if current_platform not in platforms and "all" not in platforms:
+        if t["_platforms"].isdisjoint(keep):
             continue
         if category and t["_category"] != category:
             continue
-        if test_id and t["id"] != test_id:
-            continue
         result.append(t)
     return result
 
@@ -157,10 +364,40 @@ class Infrastructure:
         self.socat_proc: subprocess.Popen[bytes] | None = None
         self.app_proc: subprocess.Popen[bytes] | None = None
         self.config_dir: str | None = None
+        self._docker_ok: bool | None = None
+        # Docker SDK client: None = not tried yet, False = unavailable
+        self._docker_client: Any = None
 
     def check_docker(self) -> bool:
-        """Check if Docker is available and running."""
-        if not shutil.which("docker"):
+        """Check if Docker is available and running (checked once per session)."""
+        if self._docker_ok is None:
+            self._docker_ok = self._probe_docker()
+        return self._docker_ok
+
+    def _sdk(self) -> Any:
+        """Return a Docker SDK client, or None to fall back to the docker CLI.
+
+        The SDK (pip install docker) is optional. It keeps one connection to
+        the daemon, so repeated queries skip the CLI start-up cost.
+        """
+        if self._docker_client is None:
+            self._docker_client = False
+            try:
+                import docker  # type: ignore[import-untyped]
+                self._docker_client = docker.from_env()
+            except Exception:  # ImportError, or DockerException without a daemon config
+                pass
+        return self._docker_client or None
+
+    def _probe_docker(self) -> bool:
+        """Check whether the Docker daemon is reachable."""
+        client = self._sdk()
+        if client:
+            try:
+                return bool(client.ping())
+            except Exception:  # docker.errors.APIError or connection errors
+                return False
+        if not _which("docker"):
             return False
         try:
             subprocess.run(
@@ -175,14 +412,14 @@ class Infrastructure:
 
     def check_serial(self) -> bool:
         """Check if socat is available for virtual serial ports."""
-        return shutil.which("socat") is not None
+        return _which("socat") is not None
 
     def check_app_binary(self, plat: str) -> str | None:
         """Find the app binary, return path or None."""
         if self.app_path:
             p = Path(self.app_path)
             return str(p) if p.exists() else None
-        default = APP_PATHS.get(plat)
+        default = app_paths().get(plat)
         if default and default.exists():
             return str(default)
         return None
@@ -191,20 +428,51 @@ class Infrastructure:
         """Start Docker test containers."""
         if self.skip_infra or self.docker_started:
             return self.docker_started
-        if not DOCKER_COMPOSE.exists():
-            print(f"  WARNING: {DOCKER_COMPOSE} not found")
+        compose_file = docker_compose_file()
+        if not compose_file.exists():
+            print(f"  WARNING: {compose_file} not found")
             return False
-        print("  Starting Docker test containers...")
+        services = self._default_services()
+        running = {
+            c.get("Service") for c in self._compose_containers() or [] if c.get("State") == "running"
+        }
+        hashes = {name: _context_hash(contexts) for name, (_, contexts) in services.items() if contexts}
+        stale = self._stale_services(services, hashes)
+        # Reuse a stack left running by an earlier --keep-infra session, but
+        # only if every default service is up and no image is out of date
+        reuse = bool(services) and set(services) <= running and not stale
+        if reuse:
+            print("  Reusing running Docker test containers...")
+        else:
+            print("  Starting Docker test containers...")
         try:
-            subprocess.run(
-                ["docker", "compose", "-f", str(DOCKER_COMPOSE), "up", "-d", "--build"],
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+            if stale:
+                print(f"  Rebuilding out-of-date images: {', '.join(stale)}")
+                subprocess.run(
+                    self._compose("build", *stale),
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            if not reuse:
+                # Plain 'up' builds images that are missing; only force a
+                # rebuild of every stage when that fails
+                up = subprocess.run(
+                    self._compose("up", "-d"),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                if up.returncode != 0:
+                    subprocess.run(
+                        self._compose("up", "-d", "--build"),
+                        check=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+                self._record_image_stamps(services, hashes)
             self.docker_started = True
-            # Wait for key ports
-            self._wait_for_port(2201, "SSH", timeout=30)
+            # Wait for key services
+            self._wait_for_services([(2201, "SSH")], timeout=30)
             return True
         except subprocess.CalledProcessError:
             print("  ERROR: Failed to start Docker containers")
@@ -216,11 +484,9 @@ class Infrastructure:
             return True
         if not self.check_serial():
             return False
-        pty_a = "/tmp/termihub-serial-a"
-        pty_b = "/tmp/termihub-serial-b"
-        for p in (pty_a, pty_b):
-            if os.path.exists(p):
-                os.remove(p)
+        pty_a, pty_b = _SOCAT_LINKS
+        for p in _SOCAT_LINKS:
+            p.unlink(missing_ok=True)
         try:
             self.socat_proc = subprocess.Popen(
                 ["socat", "-d", "-d",
@@ -229,11 +495,14 @@ class Infrastructure:
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
             )
-            # Wait for symlinks
-            for _ in range(20):
-                if os.path.exists(pty_a) and os.path.exists(pty_b):
+            # Wait for symlinks, backing off from 10ms up to 500ms (10s total)
+            deadline = time.monotonic() + 10
+            delay = 0.01
+            while time.monotonic() < deadline:
+                if pty_a.exists() and pty_b.exists():
                     return True
-                time.sleep(0.5)
+                time.sleep(delay)
+                delay = min(0.5, delay * 2)
             print("  WARNING: Virtual serial ports did not appear")
             return False
         except FileNotFoundError:
@@ -241,25 +510,25 @@ class Infrastructure:
 
     def generate_connections(self, tests: list[dict[str, Any]]) -> str:
         """Generate a connections.json in a temp dir from test setup actions."""
-        connections: list[dict[str, Any]] = []
-        seen_names: set[str] = set()
+        # Keyed by name: the first definition wins, insertion order is kept
+        conns: dict[str, dict[str, Any]] = {}
 
         for test in tests:
             for step in test.get("setup", []):
-                if isinstance(step, dict) and "create_connection" in step:
-                    conn_def = step["create_connection"]
-                    name = conn_def["name"]
-                    if name in seen_names:
-                        continue
-                    seen_names.add(name)
-                    connections.append({
-                        "type": "connection",
-                        "name": name,
-                        "config": {
-                            "type": conn_def["type"],
-                            "config": conn_def.get("config", {}),
-                        },
-                    })
+                conn_def = step.get("create_connection") if isinstance(step, dict) else None
+                if conn_def is None:
+                    continue
+                name = conn_def["name"]
+                conns.setdefault(name, {
+                    "type": "connection",
+                    "name": name,
+                    "config": {
+                        "type": conn_def["type"],
+                        "config": conn_def.get("config", {}),
+                    },
+                })
+
+        connections = list(conns.values())
 
         store = {
             "version": "2",
@@ -276,21 +545,228 @@ class Infrastructure:
 
         config_dir = tempfile.mkdtemp(prefix="termihub-manual-test-")
         self.config_dir = config_dir
-        config_file = os.path.join(config_dir, "connections.json")
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(store, f, indent=2)
+        Path(config_dir, "connections.json").write_bytes(_dumps(store))
 
         return config_dir
 
+    def _compose(self, *args: str) -> list[str]:
+        """Build a 'docker compose' command line for the test stack."""
+        return ["docker", "compose", "-f", str(docker_compose_file()), *args]
+
+    def _compose_project(self) -> str:
+        """Compose project name, as used in container labels and image names."""
+        return os.environ.get("COMPOSE_PROJECT_NAME") or docker_compose_file().parent.name.lower()
+
+    def _default_services(self) -> dict[str, tuple[str, list[Path]]]:
+        """Map each service started by a plain 'up' to its image and build contexts.
+
+        Services behind a profile are left out; services that only pull an
+        image have no contexts. Returns {} if the compose file cannot be read.
+        """
+        compose_file = docker_compose_file()
+        try:
+            data = yaml.load(compose_file.read_bytes(), Loader=_YamlLoader) or {}
+        except (OSError, yaml.YAMLError):
+            return {}
+        project = self._compose_project()
+        services: dict[str, tuple[str, list[Path]]] = {}
+        for name, svc in (data.get("services") or {}).items():
+            if svc.get("profiles"):
+                continue
+            image = svc.get("image") or f"{project}-{name}"
+            build = svc.get("build")
+            if build is None:
+                services[name] = (image, [])
+                continue
+            if isinstance(build, str):
+                build = {"context": build}
+            contexts = [build.get("context", "."), *(build.get("additional_contexts") or {}).values()]
+            services[name] = (image, [(compose_file.parent / c).resolve() for c in contexts])
+        return services
+
+    def _image_ids(self, images: list[str]) -> dict[str, str]:
+        """Map each locally present image name to its image ID."""
+        ids: dict[str, str] = {}
+        client = self._sdk()
+        if client:
+            for image in images:
+                try:
+                    ids[image] = client.images.get(image).id
+                except Exception:  # docker.errors.ImageNotFound or connection errors
+                    pass
+            return ids
+        # Missing images make the command fail, but the others are still printed
+        result = subprocess.run(
+            ["docker", "image", "inspect", "--format", "{{json .RepoTags}}\t{{.Id}}", *images],
+            capture_output=True,
+            text=True,
+        )
+        for line in result.stdout.splitlines():
+            tags, _, image_id = line.partition("\t")
+            try:
+                for tag in json.loads(tags) or []:
+                    ids[tag] = image_id
+                    if tag.endswith(":latest"):
+                        ids[tag[: -len(":latest")]] = image_id
+            except json.JSONDecodeError:
+                continue
+        return ids
+
+    def _stale_services(self, services: dict[str, tuple[str, list[Path]]], hashes: dict[str, str]) -> list[str]:
+        """Return the built services whose image is missing or not built from the current context.
+
+        An image counts as current when it is the one recorded in the stamp
+        file for the same context hash. An image built some other way is
+        rebuilt once; BuildKit's cache makes that cheap when nothing changed.
+        """
+        built = {name: image for name, (image, contexts) in services.items() if contexts}
+        if not built:
+            return []
+        ids = self._image_ids(list(built.values()))
+        try:
+            stamps = json.loads(image_stamp_file().read_bytes())
+        except (OSError, ValueError):
+            stamps = {}
+        return [
+            name for name, image in built.items()
+            if image not in ids or stamps.get(image) != {"id": ids[image], "context": hashes[name]}
+        ]
+
+    def _record_image_stamps(self, services: dict[str, tuple[str, list[Path]]], hashes: dict[str, str]) -> None:
+        """Remember the image each built service now runs and its context hash."""
+        built = {name: image for name, (image, contexts) in services.items() if contexts}
+        ids = self._image_ids(list(built.values()))
+        path = image_stamp_file()
+        try:
+            stamps = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            stamps = {}
+        for name, image in built.items():
+            if image in ids:
+                stamps[image] = {"id": ids[image], "context": hashes[name]}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(_dumps(stamps))
+        except OSError:
+            pass  # only costs a cached rebuild next session
+
+    def _compose_containers(self) -> list[dict[str, Any]] | None:
+        """List the test stack's running containers in 'compose ps' JSON shape.
+
+        Uses the Docker SDK when available, otherwise one
+        'docker compose ps --format json' call. Returns None if the states
+        cannot be queried.
+        """
+        client = self._sdk()
+        if client:
+            try:
+                found = client.containers.list(
+                    filters={"label": f"com.docker.compose.project={self._compose_project()}"},
+                )
+            except Exception:  # docker.errors.APIError or connection errors
+                return None
+            containers = []
+            for c in found:
+                state = c.attrs.get("State", {})
+                ports = c.attrs.get("NetworkSettings", {}).get("Ports") or {}
+                containers.append({
+                    "Service": c.labels.get("com.docker.compose.service", c.name),
+                    "State": state.get("Status", ""),
+                    "Health": state.get("Health", {}).get("Status", ""),
+                    "Publishers": [
+                        {"PublishedPort": int(b["HostPort"])}
+                        for bindings in ports.values() if bindings
+                        for b in bindings if b.get("HostPort")
+                    ],
+                })
+            return containers
+
+        try:
+            result = subprocess.run(
+                self._compose("ps", "--format", "json"),
+                capture_output=True,
+                text=True,
+            )
+        except FileNotFoundError:
+            return None
+        if result.returncode != 0:
+            return None
+        out = result.stdout.strip()
+        try:
+            # Older Compose prints one JSON array, newer one object per line
+            if out.startswith("["):
+                return json.loads(out)
+            return [json.loads(line) for line in out.splitlines() if line.strip()]
+        except json.JSONDecodeError:
+            return None
+
+    def _published_port_states(self) -> dict[int, bool] | None:
+        """Map each published port to whether its container is up and healthy.
+
+        Returns None if the container states cannot be queried.
+        """
+        containers = self._compose_containers()
+        if containers is None:
+            return None
+        states: dict[int, bool] = {}
+        for c in containers:
+            running = c.get("State") == "running"
+            healthy = c.get("Health", "") in ("", "healthy")
+            for pub in c.get("Publishers") or []:
+                port = pub.get("PublishedPort")
+                if port:
+                    # Health checks run seconds apart; while one is pending,
+                    # an accepting port is as ready as a plain TCP wait would find
+                    states[port] = running and (healthy or _port_open(port, timeout=0.2))
+        return states
+
+    def _wait_for_services(self, services: list[tuple[int, str]], timeout: int = 30) -> bool:
+        """Wait for the containers publishing the given (port, name) services.
+
+        All container states are fetched with one 'docker compose ps' call per
+        poll, however many services are awaited.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        # The SDK answers over one open connection, so it can be polled quickly;
+        # without it every poll spawns the compose CLI
+        delay = 0.01 if self._sdk() else 0.5
+        pending = dict(services)
+        while True:
+            states = self._published_port_states()
+            if states is None:
+                # Compose cannot report JSON; probe the ports one by one
+                remaining = max(1, int(deadline - time.monotonic()))
+                return all([
+                    self._wait_for_port(port, name, timeout=remaining)
+                    for port, name in pending.items()
+                ])
+            for port in [p for p in pending if states.get(p)]:
+                name = pending.pop(port)
+                print(f"  {name} ready on port {port} ({time.monotonic() - start:.1f}s)")
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            delay = min(0.5, delay * 2)
+        for port, name in pending.items():
+            print(f"  WARNING: {name} on port {port} not ready after {timeout}s")
+        return not pending
+
     def _wait_for_port(self, port: int, name: str, timeout: int = 30) -> bool:
         """Wait for a TCP port to become available."""
-        for i in range(timeout):
-            try:
-                with socket.create_connection(("127.0.0.1", port), timeout=1):
-                    print(f"  {name} ready on port {port} ({i + 1}s)")
-                    return True
-            except (ConnectionRefusedError, socket.timeout, OSError):
-                time.sleep(1)
+        start = time.monotonic()
+        deadline = start + timeout
+        delay = 0.01
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if _port_open(port, timeout=min(1.0, remaining)):
+                print(f"  {name} ready on port {port} ({time.monotonic() - start:.1f}s)")
+                return True
+            # Back off exponentially so fast services are picked up quickly
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            delay = min(0.5, delay * 2)
         print(f"  WARNING: {name} on port {port} not ready after {timeout}s")
         return False
 
@@ -302,9 +778,8 @@ class Infrastructure:
                 self.socat_proc.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 self.socat_proc.kill()
-            for p in ("/tmp/termihub-serial-a", "/tmp/termihub-serial-b"):
-                if os.path.exists(p):
-                    os.remove(p)
+            for p in _SOCAT_LINKS:
+                p.unlink(missing_ok=True)
 
         if self.app_proc and self.app_proc.poll() is None:
             self.app_proc.terminate()
@@ -316,7 +791,7 @@ class Infrastructure:
         if self.docker_started and not self.keep_infra:
             print("  Stopping Docker containers...")
             subprocess.run(
-                ["docker", "compose", "-f", str(DOCKER_COMPOSE), "down"],
+                self._compose("down"),
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
             )
@@ -331,6 +806,71 @@ class Infrastructure:
 # Verification engine
 # ---------------------------------------------------------------------------
 
+# '.a.b == <JSON literal>', the common shape of json_check expressions
+_SIMPLE_JQ_RE = re.compile(r"^\s*((?:\.[A-Za-z_]\w*)+)\s*==\s*(.+?)\s*$")
+
+
+def _eval_simple_jq(expr: str, doc: Any) -> bool | None:
+    """Evaluate a simple jq equality in Python; None if jq is needed."""
+    m = _SIMPLE_JQ_RE.match(expr)
+    if not m:
+        return None
+    try:
+        expected = json.loads(m.group(2))
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(expected, (str, int, float, bool)) and expected is not None:
+        # Arrays and objects may nest booleans, which compare differently
+        # from Python's (true != 1 in jq); leave those to jq
+        return None
+    value = doc
+    for key in m.group(1)[1:].split("."):
+        if value is None:
+            break
+        if not isinstance(value, dict):
+            # jq raises an error here; let it report that
+            return None
+        value = value.get(key)
+    if isinstance(value, bool) or isinstance(expected, bool):
+        # In jq, true == 1 is false
+        return value is expected
+    return value == expected
+
+
+def _process_running(name: str) -> bool:
+    """Return True if a process matching name is running (like 'pgrep -f')."""
+    if os.path.isdir("/proc"):
+        # Linux: scan command lines directly instead of forking pgrep
+        needle = name.encode()
+        own_pid = str(os.getpid())
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit() or entry.name == own_pid:
+                continue
+            try:
+                cmdline = Path(entry.path, "cmdline").read_bytes()
+            except OSError:
+                continue
+            if needle in cmdline.replace(b"\0", b" "):
+                return True
+        return False
+    if _IS_WINDOWS:
+        try:
+            import psutil  # type: ignore[import-untyped]
+            lowered = name.lower()
+            return any(
+                lowered in (p.info["name"] or "").lower()
+                for p in psutil.process_iter(["name"])
+            )
+        except ImportError:
+            result = subprocess.run(
+                ["tasklist", "/FI", f"IMAGENAME eq {name}*"],
+                capture_output=True, text=True,
+            )
+            return name.lower() in result.stdout.lower()
+    result = subprocess.run(["pgrep", "-f", name], capture_output=True)
+    return result.returncode == 0
+
+
 def run_verification(verification: Any) -> list[dict[str, Any]]:
     """Run automated verification checks. Returns list of check results."""
     if verification == "manual" or verification is None:
@@ -354,12 +894,17 @@ def run_verification(verification: Any) -> list[dict[str, Any]]:
             jq_expr = verification.get("jq", "")
             desc = verification.get("description", f"JSON check: {jq_expr}")
             try:
-                with open(path, encoding="utf-8") as f:
-                    json.load(f)
+                raw = Path(path).read_bytes()
+                doc = json.loads(raw)
+                simple = _eval_simple_jq(jq_expr, doc) if jq_expr else None
+                if simple is not None:
+                    checks.append({"description": desc, "passed": simple})
                 # Use jq if available, otherwise basic file validity
-                if shutil.which("jq") and jq_expr:
+                elif _which("jq") and jq_expr:
+                    # Feed the bytes already read instead of having jq reopen the file
                     result = subprocess.run(
-                        ["jq", "-e", jq_expr, path],
+                        ["jq", "-e", jq_expr],
+                        input=raw,
                         capture_output=True,
                     )
                     checks.append({"description": desc, "passed": result.returncode == 0})
@@ -372,19 +917,7 @@ def run_verification(verification: Any) -> list[dict[str, Any]]:
             name = verification["name"]
             desc = verification.get("description", f"Process '{name}' is running")
             try:
-                if platform.system() == "Windows":
-                    result = subprocess.run(
-                        ["tasklist", "/FI", f"IMAGENAME eq {name}*"],
-                        capture_output=True, text=True,
-                    )
-                    passed = name.lower() in result.stdout.lower()
-                else:
-                    result = subprocess.run(
-                        ["pgrep", "-f", name],
-                        capture_output=True,
-                    )
-                    passed = result.returncode == 0
-                checks.append({"description": desc, "passed": passed})
+                checks.append({"description": desc, "passed": _process_running(name)})
             except FileNotFoundError:
                 checks.append({"description": desc, "passed": False})
 
@@ -398,8 +931,13 @@ def run_verification(verification: Any) -> list[dict[str, Any]]:
                 checks.append({"description": desc, "passed": False})
 
         elif vtype == "combined":
-            for auto_check in verification.get("automated", []):
-                checks.extend(run_verification(auto_check))
+            auto_checks = verification.get("automated", [])
+            if auto_checks:
+                # Checks may block on timeouts or subprocesses; run them side by
+                # side so the slowest one, not the sum, sets the wait
+                with ThreadPoolExecutor(max_workers=min(8, len(auto_checks))) as pool:
+                    for sub in pool.map(run_verification, auto_checks):
+                        checks.extend(sub)
 
     return checks
 
@@ -408,19 +946,20 @@ def run_verification(verification: Any) -> list[dict[str, Any]]:
 # Display helpers
 # ---------------------------------------------------------------------------
 
-def box_line(text: str, width: int = 66) -> str:
-    """Format a line inside a box."""
-    return f"  {text:<{width - 4}}"
+BOX_WIDTH = 66
+_BOX_BORDER = "+" + "-" * (BOX_WIDTH - 2) + "+"
 
+_RESULT_CHOICES = "[p]ass  [f]ail  [s]kip  [n]ote  [q]uit"
+_PROMPT_BASIC = f"  {_RESULT_CHOICES}"
+_PROMPT_UNKNOWN = f"  Unknown input. {_RESULT_CHOICES}"
 
-def print_box(lines: list[str], width: int = 66) -> None:
-    """Print a bordered box."""
-    border = "+" + "-" * (width - 2) + "+"
-    print(border)
-    for line in lines:
-        padded = line[:width - 4].ljust(width - 4)
-        print(f"| {padded} |")
-    print(border)
+
+def print_box(lines: list[str], width: int = BOX_WIDTH) -> None:
+    """Print a bordered box with a single write."""
+    border = _BOX_BORDER if width == BOX_WIDTH else "+" + "-" * (width - 2) + "+"
+    w = width - 4
+    inner = "\n".join(f"| {line[:w].ljust(w)} |" for line in lines)
+    sys.stdout.write(f"{border}\n{inner}\n{border}\n")
 
 
 def print_test_card(
@@ -432,9 +971,9 @@ def print_test_card(
     lines: list[str] = []
     tid = test["id"]
     name = test["name"]
-    cat = test.get("_display_name", test.get("_category", ""))
+    cat = test["_display_name"]
     pr = test.get("pr")
-    platforms = ", ".join(test.get("platforms", ["all"]))
+    platforms = test["_platforms_str"]
 
     header = f"[{index}/{total}]  {tid}  {name}"
     lines.append(header)
@@ -476,15 +1015,15 @@ def print_test_card(
     # Verification hint
     verification = test.get("verification", "manual")
     if verification == "manual":
-        lines.append("RESULT: [p]ass  [f]ail  [s]kip  [n]ote  [q]uit")
+        lines.append(f"RESULT: {_RESULT_CHOICES}")
     elif isinstance(verification, dict):
         vtype = verification.get("type", "")
         if vtype == "combined":
             lines.append("Press Enter to run automated checks, then confirm.")
-            lines.append("[p]ass  [f]ail  [s]kip  [n]ote  [q]uit")
+            lines.append(_RESULT_CHOICES)
         else:
             lines.append("Press Enter to run automated verification.")
-            lines.append("[p]ass  [f]ail  [s]kip  [n]ote  [q]uit")
+            lines.append(_RESULT_CHOICES)
 
     print()
     print_box(lines)
@@ -500,15 +1039,12 @@ def print_session_summary(
 ) -> None:
     """Print the session overview."""
     # Count by category
-    categories: dict[str, int] = {}
-    for t in tests:
-        cat = t.get("_display_name", t.get("_category", "unknown"))
-        categories[cat] = categories.get(cat, 0) + 1
+    categories = Counter(t["_display_name"] for t in tests)
 
     lines: list[str] = []
     lines.append("termiHub Guided Manual Tests")
     lines.append(f"Platform:  {os_version} ({arch})")
-    lines.append(f"Date:      {datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}")
+    lines.append(f"Date:      {datetime.datetime.now(_UTC).strftime('%Y-%m-%dT%H:%M:%SZ')}")
     lines.append("")
     lines.append("Test categories for this platform:")
     for cat, count in categories.items():
@@ -532,12 +1068,15 @@ def print_session_summary(
     print_box(lines)
 
 
+def summarize_results(results: list[dict[str, Any]]) -> tuple[int, int, int, int]:
+    """Count results by status in one pass: (passed, failed, skipped, not_run)."""
+    counts = Counter(r["status"] for r in results)
+    return counts["passed"], counts["failed"], counts["skipped"], counts["not_run"]
+
+
 def print_results_summary(results: list[dict[str, Any]], report_path: str, start_time: float) -> None:
     """Print the final session summary."""
-    passed = sum(1 for r in results if r["status"] == "passed")
-    failed = sum(1 for r in results if r["status"] == "failed")
-    skipped = sum(1 for r in results if r["status"] == "skipped")
-    not_run = sum(1 for r in results if r["status"] == "not_run")
+    passed, failed, skipped, not_run = summarize_results(results)
 
     duration = int(time.time() - start_time)
     mins, secs = divmod(duration, 60)
@@ -574,6 +1113,31 @@ def print_results_summary(results: list[dict[str, Any]], report_path: str, start
 # Report generation
 # ---------------------------------------------------------------------------
 
+def result_stub(test: dict[str, Any]) -> dict[str, Any]:
+    """Return the report entry skeleton for a test, built on first use.
+
+    Entries are built as {**stub, ...}; overriding a key keeps its position,
+    so every entry has the same key order in the report.
+    """
+    stub = test.get("_stub")
+    if stub is None:
+        verification = test.get("verification", "manual")
+        stub = test["_stub"] = {
+            "id": test["id"],
+            # Some definitions (network-tools.yaml) use 'title' instead of 'name'
+            "name": test.get("name", test.get("title", "")),
+            "category": test["_category"],
+            "status": "not_run",
+            "timestamp": None,
+            "duration_seconds": 0,
+            "note": None,
+            "verification_type": (
+                verification.get("type", "automated") if isinstance(verification, dict) else "manual"
+            ),
+        }
+    return stub
+
+
 def build_report(
     results: list[dict[str, Any]],
     plat: str,
@@ -582,13 +1146,10 @@ def build_report(
     start_time: float,
 ) -> dict[str, Any]:
     """Build the JSON report object."""
-    now = datetime.datetime.now(datetime.timezone.utc)
-    started = datetime.datetime.fromtimestamp(start_time, tz=datetime.timezone.utc)
+    now = datetime.datetime.now(_UTC)
+    started = datetime.datetime.fromtimestamp(start_time, tz=_UTC)
 
-    passed = sum(1 for r in results if r["status"] == "passed")
-    failed = sum(1 for r in results if r["status"] == "failed")
-    skipped = sum(1 for r in results if r["status"] == "skipped")
-    not_run = sum(1 for r in results if r["status"] == "not_run")
+    passed, failed, skipped, not_run = summarize_results(results)
 
     return {
         "version": "1",
@@ -602,8 +1163,8 @@ def build_report(
             "platform": plat,
             "arch": arch,
             "os_version": os_version,
-            "docker_available": shutil.which("docker") is not None,
-            "serial_available": shutil.which("socat") is not None,
+            "docker_available": _which("docker") is not None,
+            "serial_available": _which("socat") is not None,
         },
         "summary": {
             "total": len(results),
@@ -621,11 +1182,10 @@ def save_report(report: dict[str, Any], report_dir: Path) -> str:
     report_dir.mkdir(parents=True, exist_ok=True)
     plat = report["environment"]["platform"]
     arch = report["environment"]["arch"]
-    ts = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H%M%S")
+    ts = datetime.datetime.now(_UTC).strftime("%Y-%m-%dT%H%M%S")
     filename = f"manual-{ts}-{plat}-{arch}.json"
     path = report_dir / filename
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+    path.write_bytes(_dumps(report))
     return str(path)
 
 
@@ -648,11 +1208,14 @@ def get_test_result(test: dict[str, Any]) -> tuple[str, str | None]:
     'passed', 'failed', 'skipped', 'quit'.
     """
     note: str | None = None
+    verification = test.get("verification", "manual")
+    has_auto = isinstance(verification, dict)
+    # Combined verifications follow the automated checks with a manual confirmation
+    manual_prompt = None
+    if has_auto and verification.get("type") == "combined":
+        manual_prompt = verification.get("manual_prompt", "Manual check passed?")
 
     while True:
-        verification = test.get("verification", "manual")
-        has_auto = isinstance(verification, dict)
-
         choice = get_input("\n> ")
 
         if choice == "p":
@@ -684,7 +1247,9 @@ def get_test_result(test: dict[str, Any]) -> tuple[str, str | None]:
                     print(f"    [{status_str}] {c['description']}")
                 print()
 
-                if all_passed:
+                # For combined verifications a clean run goes straight to the
+                # manual prompt below, which decides the result
+                if all_passed and not manual_prompt:
                     print("  All checks passed. Press Enter to mark as pass, or [f]ail / [s]kip")
                     confirm = get_input("  > ")
                     if confirm in ("", "p"):
@@ -698,7 +1263,7 @@ def get_test_result(test: dict[str, Any]) -> tuple[str, str | None]:
                         return ("skipped", note)
                     elif confirm == "q":
                         return ("quit", note)
-                else:
+                elif not all_passed:
                     print("  Some checks failed. [p]ass anyway / [f]ail / [s]kip")
                     confirm = get_input("  > ")
                     if confirm == "p":
@@ -718,8 +1283,7 @@ def get_test_result(test: dict[str, Any]) -> tuple[str, str | None]:
                 continue
 
             # Also handle combined manual prompt
-            if isinstance(verification, dict) and verification.get("type") == "combined":
-                manual_prompt = verification.get("manual_prompt", "Manual check passed?")
+            if manual_prompt:
                 print(f"\n  {manual_prompt} [p]ass / [f]ail / [s]kip")
                 confirm = get_input("  > ")
                 if confirm in ("", "p"):
@@ -735,29 +1299,59 @@ def get_test_result(test: dict[str, Any]) -> tuple[str, str | None]:
                     return ("quit", note)
         elif choice == "":
             # Enter with no auto verification — prompt again
-            print("  [p]ass  [f]ail  [s]kip  [n]ote  [q]uit")
+            print(_PROMPT_BASIC)
             continue
         else:
-            print("  Unknown input. [p]ass  [f]ail  [s]kip  [n]ote  [q]uit")
+            print(_PROMPT_UNKNOWN)
             continue
 
-    # Should not reach here
-    return ("skipped", note)
-
 
 # ---------------------------------------------------------------------------
 # Resume support
 # ---------------------------------------------------------------------------
 
-def load_resume(resume_path: str) -> set[str]:
-    """Load completed test IDs from a previous report."""
-    with open(resume_path, encoding="utf-8") as f:
-        report = json.load(f)
+# Entries generated in bulk (resumed and not_run tests) are checkpointed in
+# batches of this size; answered tests are written as soon as they are recorded
+_CHECKPOINT_BATCH = 5
+
+
+_RESUME_ID_RE = re.compile(r'"id"\s*:\s*"([^"\\]+)"')
+_RESUME_STATUS_RE = re.compile(r'"status"\s*:\s*"(\w+)"')
+_COMPLETED_STATUSES = frozenset(("passed", "failed", "skipped"))
+
+
+def load_resume(resume_path: str) -> frozenset[str]:
+    """Load completed test IDs from a previous report.
+
+    Accepts a final JSON report or the .partial.ndjson checkpoint left behind
+    by an interrupted session (one result per line). Checkpoint lines are
+    scanned for their id and status instead of being fully parsed.
+    """
     completed: set[str] = set()
-    for r in report.get("results", []):
-        if r.get("status") in ("passed", "failed", "skipped"):
-            completed.add(r["id"])
-    return completed
+    with open(resume_path, encoding="utf-8") as f:
+        if resume_path.endswith(".ndjson"):
+            for line in f:
+                id_match = _RESUME_ID_RE.search(line)
+                status_match = _RESUME_STATUS_RE.search(line)
+                if id_match and status_match:
+                    if status_match.group(1) in _COMPLETED_STATUSES:
+                        completed.add(id_match.group(1))
+                elif line.strip():
+                    # Escaped IDs or hand-edited lines: fall back to a real parse.
+                    # A session killed mid-write leaves a torn last line; skip
+                    # it rather than losing every result before it.
+                    try:
+                        r = json.loads(line)
+                    except json.JSONDecodeError:
+                        print(f"WARNING: Ignoring unreadable checkpoint line: {line.strip()[:60]}")
+                        continue
+                    if isinstance(r, dict) and r.get("id") and r.get("status") in _COMPLETED_STATUSES:
+                        completed.add(r["id"])
+        else:
+            for r in json.load(f).get("results", []):
+                if r.get("status") in _COMPLETED_STATUSES:
+                    completed.add(r["id"])
+    return frozenset(completed)
 
 
 # ---------------------------------------------------------------------------
@@ -777,7 +1371,7 @@ def main() -> int:
     parser.add_argument("--keep-infra", action="store_true", help="Keep Docker containers running after session")
     parser.add_argument("--app-path", help="Path to app binary (overrides auto-detection)")
     parser.add_argument("--report-dir", help="Output directory for reports")
-    parser.add_argument("--resume", help="Resume a previous session from a report file")
+    parser.add_argument("--resume", help="Resume a previous session from a report or .partial.ndjson checkpoint")
     parser.add_argument("--list", action="store_true", help="List all tests for the current platform (no run)")
 
     args = parser.parse_args()
@@ -788,14 +1382,15 @@ def main() -> int:
     os_version = detect_os_version()
 
     # Report dir
-    report_dir = Path(args.report_dir) if args.report_dir else DEFAULT_REPORT_DIR
+    report_dir = Path(args.report_dir) if args.report_dir else default_report_dir()
 
     # Load tests
-    if not TESTS_DIR.is_dir():
-        print(f"ERROR: Test definitions not found at {TESTS_DIR}")
+    manual_dir = tests_dir()
+    if not manual_dir.is_dir():
+        print(f"ERROR: Test definitions not found at {manual_dir}")
         return 1
 
-    all_tests = load_tests(TESTS_DIR)
+    all_tests = load_tests(manual_dir)
     if not all_tests:
         print("ERROR: No test definitions found")
         return 1
@@ -815,7 +1410,7 @@ def main() -> int:
         print(f"\nManual tests for {plat} ({len(filtered)} of {len(all_tests)}):\n")
         current_cat = ""
         for t in filtered:
-            cat = t.get("_display_name", "")
+            cat = t["_display_name"]
             if cat != current_cat:
                 current_cat = cat
                 print(f"\n  {cat}")
@@ -826,7 +1421,7 @@ def main() -> int:
         return 0
 
     # Resume support
-    completed_ids: set[str] = set()
+    completed_ids: frozenset[str] = frozenset()
     if args.resume:
         try:
             completed_ids = load_resume(args.resume)
@@ -861,24 +1456,65 @@ def main() -> int:
     # Main test loop
     start_time = time.time()
     results: list[dict[str, Any]] = []
-    total = len(filtered)
+    recorded_ids: set[str] = set()
+    pending = [t for t in filtered if t["id"] not in completed_ids]
+    total = len(pending)
     quit_requested = False
 
-    for i, test in enumerate(filtered, 1):
-        if test["id"] in completed_ids:
-            # Already completed in resumed session
-            results.append({
-                "id": test["id"],
-                "name": test["name"],
-                "category": test["_category"],
-                "status": "skipped",
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-                "duration_seconds": 0,
-                "note": "Skipped (completed in previous session)",
-                "verification_type": "resumed",
-            })
-            continue
-
+    # Progress is checkpointed by appending one JSON line per result, so an
+    # interrupted session can be resumed without rewriting the whole report
+    # after every test.
+    report_dir.mkdir(parents=True, exist_ok=True)
+    session_ts = datetime.datetime.fromtimestamp(start_time, tz=_UTC).strftime("%Y-%m-%dT%H%M%S")
+    partial_path = report_dir / f"manual-{session_ts}-{plat}-{arch}.partial.ndjson"
+    partial_fp = open(partial_path, "a", encoding="utf-8")
+    pending_lines: list[str] = []
+
+    def flush_checkpoint(sync: bool = False) -> None:
+        if partial_fp.closed:
+            return
+        if pending_lines:
+            partial_fp.write("".join(pending_lines))
+            pending_lines.clear()
+        partial_fp.flush()
+        if sync:
+            os.fsync(partial_fp.fileno())
+
+    # Whatever is still buffered survives an unexpected exit. SIGTERM and
+    # SIGHUP (e.g. the terminal closing) skip atexit unless turned into a
+    # normal exit, which also lets the infrastructure cleanup run.
+    atexit.register(flush_checkpoint, sync=True)
+
+    def on_terminate(signum: int, frame: Any) -> None:
+        flush_checkpoint(sync=True)
+        sys.exit(128 + signum)
+
+    for sig in (signal.SIGTERM, getattr(signal, "SIGHUP", None)):
+        if sig is not None:
+            signal.signal(sig, on_terminate)
+
+    def record(entry: dict[str, Any], batch: bool = False) -> None:
+        results.append(entry)
+        recorded_ids.add(entry["id"])
+        pending_lines.append(json.dumps(entry) + "\n")
+        if not batch or len(pending_lines) >= _CHECKPOINT_BATCH:
+            flush_checkpoint()
+
+    # Tests already completed in the resumed session are recorded up front
+    if completed_ids:
+        skip_ts = _now_iso()
+        for t in filtered:
+            if t["id"] in completed_ids:
+                record({
+                    **result_stub(t),
+                    "status": "skipped",
+                    "timestamp": skip_ts,
+                    "note": "Skipped (completed in previous session)",
+                    "verification_type": "resumed",
+                }, batch=True)
+        flush_checkpoint()
+
+    for i, test in enumerate(pending, 1):
         # Check prerequisites and start infra lazily
         prereqs = test.get("prerequisites", [])
         for prereq in prereqs:
@@ -898,67 +1534,41 @@ def main() -> int:
 
         if status == "quit":
             # Record remaining as not_run
-            results.append({
-                "id": test["id"],
-                "name": test["name"],
-                "category": test["_category"],
-                "status": "not_run",
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            record({
+                **result_stub(test),
+                "timestamp": _now_iso(),
                 "duration_seconds": int(time.time() - test_start),
                 "note": note,
-                "verification_type": str(test.get("verification", "manual")),
             })
             quit_requested = True
             break
 
-        verification = test.get("verification", "manual")
-        vtype = "manual"
-        if isinstance(verification, dict):
-            vtype = verification.get("type", "automated")
-
-        results.append({
-            "id": test["id"],
-            "name": test["name"],
-            "category": test["_category"],
+        record({
+            **result_stub(test),
             "status": status,
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "duration_seconds": int(time.time() - test_start),
             "note": note,
-            "verification_type": vtype,
         })
 
-        # Save progress after each test
-        partial_report = build_report(results, plat, arch, os_version, start_time)
-        save_report(partial_report, report_dir)
-
     # Mark remaining tests as not_run if quit early
     if quit_requested:
-        remaining_idx = next(
-            (j for j, t in enumerate(filtered) if t["id"] not in {r["id"] for r in results}),
-            len(filtered),
-        )
-        for t in filtered[remaining_idx:]:
-            if t["id"] not in {r["id"] for r in results}:
-                results.append({
-                    "id": t["id"],
-                    "name": t["name"],
-                    "category": t["_category"],
-                    "status": "not_run",
-                    "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-                    "duration_seconds": 0,
-                    "note": None,
-                    "verification_type": str(t.get("verification", "manual")),
-                })
+        remaining = [t for t in filtered if t["id"] not in recorded_ids]
+        for t in remaining:
+            record({**result_stub(t), "timestamp": _now_iso()}, batch=True)
+    flush_checkpoint()
+    partial_fp.close()
 
-    # Final report
+    # Final report; it supersedes the checkpoint
     report = build_report(results, plat, arch, os_version, start_time)
     report_path = save_report(report, report_dir)
+    partial_path.unlink(missing_ok=True)
 
     # Summary
     print_results_summary(results, report_path, start_time)
 
     # Return non-zero if any tests failed
-    failed_count = sum(1 for r in results if r["status"] == "failed")
+    _, failed_count, _, _ = summarize_results(results)
     return 1 if failed_count > 0 else 0
 
 
@@ -9,52 +9,62 @@ Usage:
 """
 
 import argparse
+import binascii
+import errno
 import os
 import sys
 import time
+from typing import Any, Callable
 
+# Size of the read buffer, allocated once and reused for every chunk
+_BUF_SIZE = 4096
 
-def echo_mode(port_path: str) -> None:
+# ASCII a-z -> A-Z, every other byte unchanged (same result as bytes.upper())
+_UPPER_TABLE = bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+def run_loop(fd: int, transform: Callable[[memoryview], Any]) -> None:
+    """Echo every chunk read from the port back through transform.
+
+    Returns when a read reports EOF. On Linux a hung-up pty raises EIO
+    instead, which main() treats the same way.
+    """
+    buf = bytearray(_BUF_SIZE)
+    bufs = [buf]
+    view = memoryview(buf)
+    while True:
+        n = os.readv(fd, bufs)
+        if n == 0:
+            return
+        os.write(fd, transform(view[:n]))
+
+
+def echo_mode(fd: int) -> None:
     """Simple echo: return exactly what was received."""
-    with open(port_path, "rb+", buffering=0) as port:
-        while True:
-            data = port.read(1024)
-            if data:
-                port.write(data)
-                port.flush()
+    run_loop(fd, lambda data: data)
 
 
-def uppercase_mode(port_path: str) -> None:
+def uppercase_mode(fd: int) -> None:
     """Echo back in uppercase (tests data transformation)."""
-    with open(port_path, "rb+", buffering=0) as port:
-        while True:
-            data = port.read(1024)
-            if data:
-                port.write(data.upper())
-                port.flush()
+    run_loop(fd, lambda data: data.tobytes().translate(_UPPER_TABLE))
 
 
-def hex_mode(port_path: str) -> None:
+def hex_mode(fd: int) -> None:
     """Echo back as hex string (tests binary data handling)."""
-    with open(port_path, "rb+", buffering=0) as port:
-        while True:
-            data = port.read(1024)
-            if data:
-                hex_str = data.hex().encode("ascii") + b"\n"
-                port.write(hex_str)
-                port.flush()
+    run_loop(fd, lambda data: binascii.b2a_hex(data) + b"\n")
 
 
-def slow_mode(port_path: str) -> None:
+def slow_mode(fd: int) -> None:
     """Echo back one byte at a time with 50ms delay (tests buffering)."""
-    with open(port_path, "rb+", buffering=0) as port:
-        while True:
-            data = port.read(1024)
-            if data:
-                for byte in data:
-                    port.write(bytes([byte]))
-                    port.flush()
-                    time.sleep(0.05)
+    while True:
+        data = os.read(fd, _BUF_SIZE)
+        if not data:
+            return
+        # Single-byte memoryview slices: no new bytes object per byte
+        view = memoryview(data)
+        for i in range(len(view)):
+            os.write(fd, view[i : i + 1])
+            time.sleep(0.05)
 
 
 MODES = {
@@ -76,17 +86,29 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    # Wait for the port to become available
-    for _ in range(30):
-        if os.path.exists(args.port_path):
-            break
-        time.sleep(0.5)
-    else:
-        print(f"ERROR: Port {args.port_path} not available after 15s", file=sys.stderr)
-        sys.exit(1)
+    # Wait for the port to become available, polling quickly at first since
+    # socat usually creates it within a few milliseconds
+    deadline = time.monotonic() + 15.0
+    delay = 0.01
+    while not os.path.exists(args.port_path):
+        if time.monotonic() >= deadline:
+            print(f"ERROR: Port {args.port_path} not available after 15s", file=sys.stderr)
+            sys.exit(1)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
 
     print(f"Serial echo server started: {args.port_path} (mode={args.mode})")
-    MODES[args.mode](args.port_path)
+    # Raw fd: unbuffered reads and writes straight to the device, no flush needed
+    fd = os.open(args.port_path, os.O_RDWR | os.O_NOCTTY)
+    try:
+        MODES[args.mode](fd)
+    except OSError as e:
+        # Linux reports a hung-up pty as EIO rather than EOF
+        if e.errno != errno.EIO:
+            raise
+    finally:
+        os.close(fd)
+    print(f"Serial echo server stopped: {args.port_path} closed")
 
 
 if __name__ == "__main__":